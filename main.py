@@ -262,6 +262,7 @@ def main():
         database = Database(config.db_path)
         executor = Executor(config.openai_api_key, config.ai_model)
         executor.execution_timeout = config.execution_timeout
+        executor.max_connections_per_host = config.max_connections_per_host
         
         global scheduler
         scheduler = Scheduler(database, executor)
@@ -30,6 +30,7 @@ class Config:
         # Scheduler configuration
         self.check_interval = int(os.environ.get("MCP_SCHEDULER_CHECK_INTERVAL", "5"))
         self.execution_timeout = int(os.environ.get("MCP_SCHEDULER_EXECUTION_TIMEOUT", "300"))
+        self.max_connections_per_host = int(os.environ.get("MCP_SCHEDULER_MAX_CONNECTIONS_PER_HOST", "8"))
         
         # AI configuration
         self.openai_api_key = os.environ.get("OPENAI_API_KEY", None)
@@ -68,6 +69,7 @@ class Config:
             # Scheduler configuration
             self.check_interval = config.get("scheduler", {}).get("check_interval", self.check_interval)
             self.execution_timeout = config.get("scheduler", {}).get("execution_timeout", self.execution_timeout)
+            self.max_connections_per_host = config.get("scheduler", {}).get("max_connections_per_host", self.max_connections_per_host)
             
             # AI configuration
             self.openai_api_key = config.get("ai", {}).get("openai_api_key", self.openai_api_key)
@@ -96,7 +98,8 @@ class Config:
             },
             "scheduler": {
                 "check_interval": self.check_interval,
-                "execution_timeout": self.execution_timeout
+                "execution_timeout": self.execution_timeout,
+                "max_connections_per_host": self.max_connections_per_host
             },
             "ai": {
                 "model": self.ai_model,
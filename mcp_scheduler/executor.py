@@ -7,14 +7,16 @@ import shlex
 import subprocess
 import platform
 import os
+import threading
 from datetime import datetime
 import aiohttp
-from typing import Optional, Tuple
-
-import openai
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from .task import Task, TaskExecution, TaskStatus, TaskType
 
+if TYPE_CHECKING:
+    import openai
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,10 +28,82 @@ class Executor:
         self.api_key = api_key
         self.ai_model = model
         self.execution_timeout = 300  # 5 minutes default timeout
+        self.max_connections_per_host = 8  # concurrent API calls per host
         self.is_windows = platform.system() == "Windows"
+        # One keep-alive HTTP session and AI client per event loop; the scheduler
+        # thread and the MCP server each run their own loop and may both execute
+        # tasks. Each one must be closed on the loop that owns it (see close()).
+        self._http_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._ai_clients: Dict[asyncio.AbstractEventLoop, "openai.AsyncOpenAI"] = {}
+        # Both threads share this executor; guards the maps above
+        self._clients_lock = threading.Lock()
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session for the running loop, opening it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            session = self._http_sessions.get(loop)
+            if session is None or session.closed:
+                # Concurrent API tasks share the pool; requests beyond the per-host
+                # limit wait for a free connection instead of piling onto the server
+                connector = aiohttp.TCPConnector(limit_per_host=self.max_connections_per_host)
+                session = aiohttp.ClientSession(connector=connector)
+                self._forget_closed_loops(self._http_sessions)
+                self._http_sessions[loop] = session
+            return session
+    
+    def _get_ai_client(self) -> "openai.AsyncOpenAI":
+        """Get the OpenAI client for the running loop, creating it on first use."""
+        # Imported here, outside the lock: the openai package is slow to
+        # import and only AI tasks need it
+        import openai
+        
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            client = self._ai_clients.get(loop)
+            if client is None:
+                client = openai.AsyncOpenAI(api_key=self.api_key)
+                self._forget_closed_loops(self._ai_clients)
+                self._ai_clients[loop] = client
+            return client
+    
+    @staticmethod
+    def _forget_closed_loops(clients: dict) -> None:
+        """Drop entries whose loop has been closed; call with _clients_lock held."""
+        for loop in [loop for loop in clients if loop.is_closed()]:
+            del clients[loop]
+    
+    async def close(self) -> None:
+        """Close the pooled HTTP sessions and AI clients on every loop."""
+        with self._clients_lock:
+            sessions, self._http_sessions = self._http_sessions, {}
+            clients, self._ai_clients = self._ai_clients, {}
+        
+        for loop, session in sessions.items():
+            if not session.closed:
+                await self._close_on_loop(loop, session.close())
+        for loop, client in clients.items():
+            await self._close_on_loop(loop, client.close())
+    
+    async def _close_on_loop(self, loop: asyncio.AbstractEventLoop, closer) -> None:
+        """Run a close coroutine on the loop that owns the resource."""
+        if loop.is_closed():
+            # Nothing can run there any more; its transports are already gone
+            closer.close()
+            return
         
-        if api_key:
-            openai.api_key = api_key
+        try:
+            if loop is asyncio.get_running_loop():
+                await closer
+            elif loop.is_running():
+                # e.g. SIGTERM shutdown runs on a fresh loop while the scheduler
+                # thread's loop still owns its session
+                future = asyncio.run_coroutine_threadsafe(closer, loop)
+                await asyncio.wait_for(asyncio.wrap_future(future), timeout=5)
+            else:
+                closer.close()
+        except Exception as e:
+            logger.warning(f"Error closing executor client: {e}")
     
     async def execute_task(self, task: Task) -> TaskExecution:
         """Execute a task based on its type."""
@@ -38,7 +112,7 @@ class Executor:
         execution = TaskExecution(task_id=task.id)
         
         try:
-            if task.type.value == "shell_command":
+            if task.type == TaskType.SHELL_COMMAND:
                 output, error = await self._execute_shell_command(task.command)
                 if error:
                     execution.status = TaskStatus.FAILED
@@ -47,7 +121,7 @@ class Executor:
                     execution.status = TaskStatus.COMPLETED
                     execution.output = output
                     
-            elif task.type.value == "api_call":
+            elif task.type == TaskType.API_CALL:
                 output, error = await self._execute_api_call(
                     task.api_url, 
                     task.api_method, 
@@ -61,7 +135,7 @@ class Executor:
                     execution.status = TaskStatus.COMPLETED
                     execution.output = output
                     
-            elif task.type.value == "ai":
+            elif task.type == TaskType.AI:
                 output, error = await self._execute_ai_task(task.prompt)
                 if error:
                     execution.status = TaskStatus.FAILED
@@ -70,7 +144,7 @@ class Executor:
                     execution.status = TaskStatus.COMPLETED
                     execution.output = output
                     
-            elif task.type.value == "reminder":
+            elif task.type == TaskType.REMINDER:
                 output, error = await self._execute_reminder_task(
                     task.reminder_title or task.name,
                     task.reminder_message
@@ -176,27 +250,27 @@ class Executor:
         method = method.upper()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                request_kwargs = {
-                    "headers": headers or {},
-                }
+            session = self._get_http_session()
+            request_kwargs = {
+                "headers": headers or {},
+            }
+            
+            if method in ["POST", "PUT", "PATCH"] and body:
+                request_kwargs["json"] = body
+            
+            async with session.request(
+                method, 
+                url, 
+                **request_kwargs,
+                timeout=aiohttp.ClientTimeout(total=self.execution_timeout)
+            ) as response:
+                response_text = await response.text()
                 
-                if method in ["POST", "PUT", "PATCH"] and body:
-                    request_kwargs["json"] = body
+                if response.status >= 400:
+                    return None, f"API call failed with status {response.status}: {response_text}"
+                
+                return response_text, None
                 
-                async with session.request(
-                    method, 
-                    url, 
-                    **request_kwargs,
-                    timeout=aiohttp.ClientTimeout(total=self.execution_timeout)
-                ) as response:
-                    response_text = await response.text()
-                    
-                    if response.status >= 400:
-                        return None, f"API call failed with status {response.status}: {response_text}"
-                    
-                    return response_text, None
-                    
         except aiohttp.ClientError as e:
             return None, f"API call failed: {str(e)}"
         except asyncio.TimeoutError:
@@ -211,8 +285,7 @@ class Executor:
             return None, "No API key configured for AI tasks"
         
         try:
-            completion = await asyncio.to_thread(
-                openai.chat.completions.create,
+            completion = await self._get_ai_client().chat.completions.create(
                 model=self.ai_model,
                 messages=[
                     {"role": "system", "content": "You are a helpful assistant executing scheduled tasks."},
@@ -7,7 +7,7 @@ import logging
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
-from .task import Task, TaskExecution, TaskStatus, TaskType
+from .task import Task, TaskExecution, TaskStatus, TaskType, sanitize_ascii
 
 logger = logging.getLogger(__name__)
 
@@ -80,10 +80,18 @@ class Database:
     
     def save_task(self, task: Task) -> None:
         """Save a task to the database."""
+        self.save_tasks([task])
+    
+    def save_tasks(self, tasks: List[Task]) -> None:
+        """Save several tasks to the database in a single transaction."""
+        if not tasks:
+            return
+        
+        rows = [self._task_to_row(task) for task in tasks]
         with sqlite3.connect(self.db_path) as conn:
             # Check if reminder columns exist
             try:
-                conn.execute(
+                conn.executemany(
                     """
                     INSERT OR REPLACE INTO tasks
                     (id, name, schedule, type, command, api_url, api_method, api_headers, 
@@ -91,32 +99,11 @@ class Database:
                      status, created_at, updated_at, reminder_title, reminder_message)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        task.id,
-                        task.name,
-                        task.schedule,
-                        task.type.value,
-                        task.command,
-                        task.api_url,
-                        task.api_method,
-                        json.dumps(task.api_headers) if task.api_headers else None,
-                        json.dumps(task.api_body) if task.api_body else None,
-                        task.prompt,
-                        task.description,
-                        1 if task.enabled else 0,
-                        1 if task.do_only_once else 0,
-                        task.last_run.isoformat() if task.last_run else None,
-                        task.next_run.isoformat() if task.next_run else None,
-                        task.status.value,
-                        task.created_at.isoformat(),
-                        task.updated_at.isoformat(),
-                        task.reminder_title,
-                        task.reminder_message
-                    )
+                    rows
                 )
             except sqlite3.OperationalError:
                 # Fallback for databases without reminder columns
-                conn.execute(
+                conn.executemany(
                     """
                     INSERT OR REPLACE INTO tasks
                     (id, name, schedule, type, command, api_url, api_method, api_headers, 
@@ -124,26 +111,7 @@ class Database:
                      status, created_at, updated_at)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        task.id,
-                        task.name,
-                        task.schedule,
-                        task.type.value,
-                        task.command,
-                        task.api_url,
-                        task.api_method,
-                        json.dumps(task.api_headers) if task.api_headers else None,
-                        json.dumps(task.api_body) if task.api_body else None,
-                        task.prompt,
-                        task.description,
-                        1 if task.enabled else 0,
-                        1 if task.do_only_once else 0,
-                        task.last_run.isoformat() if task.last_run else None,
-                        task.next_run.isoformat() if task.next_run else None,
-                        task.status.value,
-                        task.created_at.isoformat(),
-                        task.updated_at.isoformat()
-                    )
+                    [row[:18] for row in rows]
                 )
                 
                 # Log warning about missing reminder columns
@@ -161,7 +129,7 @@ class Database:
             if not row:
                 return None
                 
-            return self._row_to_task(row)
+            return self._row_to_task(row, self._has_reminder_columns(cursor))
     
     def get_all_tasks(self) -> List[Task]:
         """Get all tasks."""
@@ -170,7 +138,9 @@ class Database:
             cursor = conn.execute("SELECT * FROM tasks")
             rows = cursor.fetchall()
             
-            return [self._row_to_task(row) for row in rows]
+            # Resolve the schema once for the whole result set, not per row
+            has_reminder_fields = self._has_reminder_columns(cursor)
+            return [self._row_to_task(row, has_reminder_fields) for row in rows]
     
     def delete_task(self, task_id: str) -> bool:
         """Delete a task by ID."""
@@ -194,9 +164,11 @@ class Database:
                     execution.task_id,
                     execution.start_time.isoformat(),
                     execution.end_time.isoformat() if execution.end_time else None,
-                    execution.status.value,
-                    execution.output,
-                    execution.error
+                    execution.status,
+                    # Fields assigned after construction bypass the model's
+                    # validators, so the ASCII rule is enforced here as well
+                    sanitize_ascii(execution.output),
+                    sanitize_ascii(execution.error)
                 )
             )
             conn.commit()
@@ -213,23 +185,59 @@ class Database:
             
             return [self._row_to_execution(row) for row in rows]
     
-    def _row_to_task(self, row: sqlite3.Row) -> Task:
+    def _task_to_row(self, task: Task) -> tuple:
+        """Convert a Task object to a row tuple in tasks column order."""
+        # Text fields can be changed by plain attribute assignment (e.g.
+        # Scheduler.update_task), which skips validation; re-apply the ASCII
+        # rule so stored rows always satisfy it
+        return (
+            task.id,
+            sanitize_ascii(task.name),
+            task.schedule,
+            task.type,
+            sanitize_ascii(task.command),
+            task.api_url,
+            task.api_method,
+            json.dumps(task.api_headers) if task.api_headers else None,
+            json.dumps(task.api_body) if task.api_body else None,
+            sanitize_ascii(task.prompt),
+            sanitize_ascii(task.description),
+            1 if task.enabled else 0,
+            1 if task.do_only_once else 0,
+            task.last_run.isoformat() if task.last_run else None,
+            task.next_run.isoformat() if task.next_run else None,
+            task.status,
+            task.created_at.isoformat(),
+            task.updated_at.isoformat(),
+            sanitize_ascii(task.reminder_title),
+            sanitize_ascii(task.reminder_message)
+        )
+    
+    @staticmethod
+    def _has_reminder_columns(cursor: sqlite3.Cursor) -> bool:
+        """Check whether a tasks query returned the reminder columns."""
+        columns = {description[0] for description in cursor.description}
+        return "reminder_title" in columns and "reminder_message" in columns
+    
+    def _row_to_task(self, row: sqlite3.Row, has_reminder_fields: bool) -> Task:
         """Convert a database row to a Task object."""
-        # Check for reminder fields in the row
-        has_reminder_fields = "reminder_title" in row.keys() and "reminder_message" in row.keys()
-        
-        task = Task(
+        # Rows are rebuilt with model_construct() to skip the validators; the
+        # columns are still converted explicitly. Text columns are re-sanitized
+        # because databases written before save_task() enforced the ASCII rule
+        # can hold non-ASCII text (sanitize_ascii is a no-op scan for ASCII).
+        # Anything from outside the scheduler must go through Task(...) instead.
+        fields = dict(
             id=row["id"],
-            name=row["name"],
+            name=sanitize_ascii(row["name"]),
             schedule=row["schedule"],
             type=TaskType(row["type"]),
-            command=row["command"],
+            command=sanitize_ascii(row["command"]),
             api_url=row["api_url"],
             api_method=row["api_method"],
             api_headers=json.loads(row["api_headers"]) if row["api_headers"] else None,
             api_body=json.loads(row["api_body"]) if row["api_body"] else None,
-            prompt=row["prompt"],
-            description=row["description"],
+            prompt=sanitize_ascii(row["prompt"]),
+            description=sanitize_ascii(row["description"]),
             enabled=bool(row["enabled"]),
             do_only_once=bool(row["do_only_once"]),
             last_run=datetime.fromisoformat(row["last_run"]) if row["last_run"] else None,
@@ -241,19 +249,20 @@ class Database:
         
         # Add reminder fields if available
         if has_reminder_fields:
-            task.reminder_title = row["reminder_title"]
-            task.reminder_message = row["reminder_message"]
+            fields["reminder_title"] = sanitize_ascii(row["reminder_title"])
+            fields["reminder_message"] = sanitize_ascii(row["reminder_message"])
             
-        return task
+        return Task.model_construct(**fields)
     
     def _row_to_execution(self, row: sqlite3.Row) -> TaskExecution:
         """Convert a database row to a TaskExecution object."""
-        return TaskExecution(
+        # Rebuilt without validation; output/error are re-sanitized as in _row_to_task.
+        return TaskExecution.model_construct(
             id=row["id"],
             task_id=row["task_id"],
             start_time=datetime.fromisoformat(row["start_time"]),
             end_time=datetime.fromisoformat(row["end_time"]) if row["end_time"] else None,
             status=TaskStatus(row["status"]),
-            output=row["output"],
-            error=row["error"]
+            output=sanitize_ascii(row["output"]),
+            error=sanitize_ascii(row["error"])
         )
\ No newline at end of file
@@ -58,6 +58,9 @@ class Scheduler:
         for task_id, task in running_tasks:
             logger.info(f"Cancelling running task: {task_id}")
             task.cancel()
+        
+        # Release the executor's pooled HTTP connections
+        await self.executor.close()
     
     async def _scheduler_loop(self):
         """Main scheduler loop to check for tasks to run."""
@@ -78,6 +81,7 @@ class Scheduler:
         try:
             tasks = self.database.get_all_tasks()
             now = datetime.utcnow()
+            scheduled = []
             
             for task in tasks:
                 # Skip disabled tasks
@@ -93,7 +97,7 @@ class Scheduler:
                     try:
                         cron = croniter.croniter(task.schedule, now)
                         task.next_run = cron.get_next(datetime)
-                        self.database.save_task(task)
+                        scheduled.append(task)
                     except Exception as e:
                         logger.error(f"Invalid cron expression for task {task.id}: {e}")
                         continue
@@ -103,6 +107,10 @@ class Scheduler:
                     self._running_tasks[task.id] = asyncio.create_task(
                         self._execute_task(task)
                     )
+            
+            # Persist newly calculated run times in one transaction; this runs
+            # before any of the execution tasks started above get to save.
+            self.database.save_tasks(scheduled)
         except Exception:
             logger.exception("Error checking tasks")
     
@@ -158,7 +158,7 @@ class SchedulerServer:
                     "id": exec.id,
                     "start_time": exec.start_time.isoformat(),
                     "end_time": exec.end_time.isoformat() if exec.end_time else None,
-                    "status": exec.status.value,
+                    "status": exec.status,
                     "output": exec.output[:1000] if exec.output else None,  # Limit output size
                     "error": exec.error
                 }
@@ -378,7 +378,7 @@ class SchedulerServer:
                 "id": execution.id,
                 "start_time": execution.start_time.isoformat(),
                 "end_time": execution.end_time.isoformat() if execution.end_time else None,
-                "status": execution.status.value,
+                "status": execution.status,
                 "output": execution.output[:1000] if execution.output else None,  # Limit output size
                 "error": execution.error
             }
@@ -395,7 +395,7 @@ class SchedulerServer:
                     "task_id": exec.task_id,
                     "start_time": exec.start_time.isoformat(),
                     "end_time": exec.end_time.isoformat() if exec.end_time else None,
-                    "status": exec.status.value,
+                    "status": exec.status,
                     "output": exec.output[:1000] if exec.output else None,  # Limit output size
                     "error": exec.error
                 }
@@ -421,11 +421,11 @@ class SchedulerServer:
             "name": task.name,
             "schedule": task.schedule,
             "schedule_human_readable": human_readable_cron(task.schedule),
-            "type": task.type.value,
+            "type": task.type,
             "description": task.description,
             "enabled": task.enabled,
             "do_only_once": task.do_only_once,
-            "status": task.status.value,
+            "status": task.status,
             "created_at": task.created_at.isoformat(),
             "updated_at": task.updated_at.isoformat(),
             "last_run": task.last_run.isoformat() if task.last_run else None,
@@ -3,13 +3,13 @@ Task model implementation for MCP Scheduler.
 """
 from __future__ import annotations
 
-import uuid
 import re
+from os import urandom
 from datetime import datetime
 from enum import Enum
 from typing import Literal, Optional, List, Dict, Any
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class TaskStatus(str, Enum):
@@ -29,16 +29,38 @@ class TaskType(str, Enum):
     REMINDER = "reminder"  # New task type for reminders
 
 
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+
+
 def sanitize_ascii(text: str) -> str:
     """Strips non-ASCII characters from a string."""
-    if not text:
+    if not text or text.isascii():
         return text
-    return re.sub(r'[^\x00-\x7F]+', '', text)
+    return _NON_ASCII_RE.sub('', text)
+
+
+# User-visible text fields of a Task that are restricted to ASCII
+_ASCII_FIELDS = ("name", "command", "prompt", "description", "reminder_title", "reminder_message")
+
+# Fields each task type must provide, with the error raised when one is missing
+_REQUIRED_BY_TYPE = {
+    TaskType.SHELL_COMMAND: (("command", "Command is required for shell_command tasks"),),
+    TaskType.API_CALL: (("api_url", "API URL is required for api_call tasks"),),
+    TaskType.AI: (("prompt", "Prompt is required for AI tasks"),),
+    TaskType.REMINDER: (("reminder_message", "Message is required for reminder tasks"),),
+}
+
+# Datetime fields rendered as ISO strings by to_dict()
+_TASK_DATETIME_FIELDS = ("last_run", "next_run", "created_at", "updated_at")
+_EXECUTION_DATETIME_FIELDS = ("start_time", "end_time")
 
 
 class Task(BaseModel):
     """Model representing a scheduled task."""
-    id: str = Field(default_factory=lambda: f"task_{uuid.uuid4().hex[:12]}")
+    # Tasks are mutated in place by the scheduler; assignments are not re-validated
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+    
+    id: str = Field(default_factory=lambda: f"task_{urandom(6).hex()}")
     name: str
     schedule: str
     type: TaskType = TaskType.SHELL_COMMAND
@@ -60,70 +82,53 @@ class Task(BaseModel):
     reminder_title: Optional[str] = None
     reminder_message: Optional[str] = None
 
-    @validator("name", "command", "prompt", "description", "reminder_title", "reminder_message", pre=True)
-    def validate_ascii_fields(cls, v):
-        """Ensure all user-visible text fields contain only ASCII characters."""
-        if isinstance(v, str):
-            return sanitize_ascii(v)
-        return v
-
-    @validator("command")
-    def validate_command(cls, v, values):
-        """Validate that a command is provided for shell_command tasks."""
-        if values.get("type") == TaskType.SHELL_COMMAND and not v:
-            raise ValueError("Command is required for shell_command tasks")
-        return v
-    
-    @validator("api_url")
-    def validate_api_url(cls, v, values):
-        """Validate that API URL is provided for api_call tasks."""
-        if values.get("type") == TaskType.API_CALL and not v:
-            raise ValueError("API URL is required for api_call tasks")
-        return v
-
-    @validator("prompt")
-    def validate_prompt(cls, v, values):
-        """Validate that a prompt is provided for AI tasks."""
-        if values.get("type") == TaskType.AI and not v:
-            raise ValueError("Prompt is required for AI tasks")
-        return v
-    
-    @validator("reminder_message")
-    def validate_reminder_message(cls, v, values):
-        """Validate that a message is provided for reminder tasks."""
-        if values.get("type") == TaskType.REMINDER and not v:
-            raise ValueError("Message is required for reminder tasks")
-        return v
+    @model_validator(mode="before")
+    @classmethod
+    def validate_fields(cls, data: Any) -> Any:
+        """Strip non-ASCII text and check the fields required by the task type."""
+        if not isinstance(data, dict):
+            return data
+        
+        # Pure-ASCII values (the common case) are left alone, and the input
+        # is only copied when a field actually needs stripping
+        copied = False
+        for field in _ASCII_FIELDS:
+            value = data.get(field)
+            if isinstance(value, str) and not value.isascii():
+                if not copied:
+                    data = dict(data)
+                    copied = True
+                data[field] = _NON_ASCII_RE.sub('', value)
+        
+        # Non-string types are left for pydantic to reject as a ValidationError
+        task_type = data.get("type", TaskType.SHELL_COMMAND)
+        required = _REQUIRED_BY_TYPE.get(task_type, ()) if isinstance(task_type, str) else ()
+        for field, message in required:
+            if not data.get(field):
+                raise ValueError(message)
+        
+        return data
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert the task to a dictionary for serialization."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "schedule": self.schedule,
-            "type": self.type.value,
-            "command": self.command,
-            "api_url": self.api_url,
-            "api_method": self.api_method,
-            "api_headers": self.api_headers,
-            "api_body": self.api_body,
-            "prompt": self.prompt,
-            "description": self.description,
-            "enabled": self.enabled,
-            "do_only_once": self.do_only_once,
-            "last_run": self.last_run.isoformat() if self.last_run else None,
-            "next_run": self.next_run.isoformat() if self.next_run else None,
-            "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "reminder_title": self.reminder_title,
-            "reminder_message": self.reminder_message
-        }
+        """Convert the task to a dictionary for serialization.
+        
+        Datetimes are rendered as ISO strings. ``type`` and ``status`` are
+        returned as their TaskType/TaskStatus members, which are str
+        subclasses and encode to their plain values in JSON.
+        """
+        data = {field: getattr(self, field) for field in type(self).model_fields}
+        for field in _TASK_DATETIME_FIELDS:
+            value = data[field]
+            if value is not None:
+                data[field] = value.isoformat()
+        return data
 
 
 class TaskExecution(BaseModel):
     """Model representing a task execution."""
-    id: str = Field(default_factory=lambda: f"exec_{uuid.uuid4().hex[:12]}")
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+    
+    id: str = Field(default_factory=lambda: f"exec_{urandom(6).hex()}")
     task_id: str
     start_time: datetime = Field(default_factory=datetime.utcnow)
     end_time: Optional[datetime] = None
@@ -131,21 +136,23 @@ class TaskExecution(BaseModel):
     output: Optional[str] = None
     error: Optional[str] = None
     
-    @validator("output", "error", pre=True)
+    @field_validator("output", "error", mode="before")
+    @classmethod
     def validate_ascii_output(cls, v):
         """Ensure output and error fields contain only ASCII characters."""
-        if isinstance(v, str):
-            return sanitize_ascii(v)
+        if isinstance(v, str) and not v.isascii():
+            return _NON_ASCII_RE.sub('', v)
         return v
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert the execution to a dictionary for serialization."""
-        return {
-            "id": self.id,
-            "task_id": self.task_id,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat() if self.end_time else None,
-            "status": self.status.value,
-            "output": self.output,
-            "error": self.error
-        }
\ No newline at end of file
+        """Convert the execution to a dictionary for serialization.
+        
+        Datetimes are rendered as ISO strings; ``status`` is returned as its
+        TaskStatus member (a str subclass).
+        """
+        data = {field: getattr(self, field) for field in type(self).model_fields}
+        for field in _EXECUTION_DATETIME_FIELDS:
+            value = data[field]
+            if value is not None:
+                data[field] = value.isoformat()
+        return data
@@ -1,6 +1,7 @@
 """
 Utility functions for MCP Scheduler.
 """
+import functools
 import logging
 import sys
 from typing import Optional
@@ -73,6 +74,7 @@ def format_duration(seconds: int) -> str:
     return f"{days} day{'s' if days != 1 else ''} {hours} hour{'s' if hours != 1 else ''}"
 
 
+@functools.lru_cache(maxsize=256)
 def human_readable_cron(cron_expression: str) -> str:
     """Convert a cron expression to a human-readable string."""
     try:
@@ -12,3 +12,31 @@ async def test_executor_run_shell():
     result = await e.run_shell("echo hi")
     assert result.output.strip() == "hi"
     assert result.status == "success"
+
+@pytest.mark.asyncio
+async def test_executor_reuses_http_session():
+    e = Executor()
+    session = e._get_http_session()
+    assert e._get_http_session() is session
+    await e.close()
+    assert session.closed
+
+@pytest.mark.asyncio
+async def test_executor_close_reaches_other_loops():
+    import threading
+    e = Executor("sk-test")
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever, daemon=True)
+    thread.start()
+    try:
+        async def open_clients():
+            return e._get_http_session(), e._get_ai_client()
+        session, client = asyncio.run_coroutine_threadsafe(open_clients(), other).result(5)
+        await e.close()
+        assert session.closed
+        assert client.is_closed()
+        assert not e._http_sessions and not e._ai_clients
+    finally:
+        other.call_soon_threadsafe(other.stop)
+        thread.join(5)
+        other.close()
@@ -71,3 +71,83 @@ async def test_scheduler_remove_task(temp_db):
     t2 = await scheduler.get_task(t.id)
     assert t2 is None
     await scheduler.stop()
+
+@pytest.mark.asyncio
+async def test_scheduler_check_tasks_sets_next_run(temp_db):
+    config = Config()
+    db = Database(temp_db)
+    executor = Executor(None, config.ai_model)
+    scheduler = Scheduler(db, executor)
+    tasks = [
+        Task(name=f"Batch{i}", schedule="0 0 * * *", type=TaskType.SHELL_COMMAND, command="echo hi")
+        for i in range(3)
+    ]
+    db.save_tasks(tasks)
+    await scheduler._check_tasks()
+    stored = db.get_all_tasks()
+    assert len(stored) == 3
+    assert all(t.next_run is not None for t in stored)
+
+def test_database_round_trips_api_task(temp_db):
+    db = Database(temp_db)
+    task = Task(
+        name="Api", schedule="* * * * *", type=TaskType.API_CALL, api_url="http://example.com",
+        api_headers={"X-Key": "1"}, api_body={"items": [1, {"a": None}]}
+    )
+    db.save_task(task)
+    stored = db.get_task(task.id)
+    assert stored.api_headers == {"X-Key": "1"}
+    assert stored.api_body == {"items": [1, {"a": None}]}
+
+@pytest.mark.asyncio
+async def test_scheduler_stores_ascii_only_text(temp_db):
+    config = Config()
+    db = Database(temp_db)
+    executor = Executor(None, config.ai_model)
+    scheduler = Scheduler(db, executor)
+    task = Task(name="Ascii", schedule="* * * * *", type=TaskType.SHELL_COMMAND, command="echo café")
+    t = await scheduler.add_task(task)
+    await scheduler.run_task_now(t.id)
+    executions = db.get_executions(t.id)
+    assert executions[0].output == "caf"
+    await scheduler.update_task(t.id, name="naïve")
+    assert db.get_task(t.id).name == "nave"
+    await executor.close()
+
+def test_database_saves_big_int_api_body(temp_db):
+    db = Database(temp_db)
+    task = Task(
+        name="BigInt", schedule="* * * * *", type=TaskType.API_CALL, api_url="http://example.com",
+        api_body={"n": 2 ** 70 + 1}
+    )
+    db.save_task(task)
+    stored = db.get_task(task.id).api_body["n"]
+    assert isinstance(stored, int) and stored == 2 ** 70 + 1
+
+def test_database_sanitizes_legacy_rows(temp_db):
+    import sqlite3
+    db = Database(temp_db)
+    task = Task(name="Legacy", schedule="* * * * *", type=TaskType.SHELL_COMMAND, command="echo hi")
+    db.save_task(task)
+    # Simulate rows written before the ASCII rule was enforced on save
+    with sqlite3.connect(temp_db) as conn:
+        conn.execute("UPDATE tasks SET name = ? WHERE id = ?", ("naïve", task.id))
+        conn.execute(
+            "INSERT INTO executions (id, task_id, start_time, status, output, error) VALUES (?, ?, ?, ?, ?, ?)",
+            ("exec_legacy", task.id, "2024-01-01T00:00:00", "completed", "été", "café")
+        )
+    assert db.get_task(task.id).name == "nave"
+    execution = db.get_executions(task.id)[0]
+    assert execution.output == "t"
+    assert execution.error == "caf"
+
+def test_database_keeps_non_finite_api_body(temp_db):
+    import math
+    db = Database(temp_db)
+    task = Task(
+        name="NaN", schedule="* * * * *", type=TaskType.API_CALL, api_url="http://example.com",
+        api_body={"a": float("nan"), "b": float("inf")}
+    )
+    db.save_task(task)
+    stored = db.get_task(task.id).api_body
+    assert math.isnan(stored["a"]) and stored["b"] == float("inf")
@@ -0,0 +1,50 @@
+import pytest
+from pydantic import ValidationError
+from mcp_scheduler.task import Task, TaskExecution, TaskType, sanitize_ascii
+
+def test_sanitize_ascii():
+    assert sanitize_ascii("hello") == "hello"
+    assert sanitize_ascii("héllo wörld") == "hllo wrld"
+    assert sanitize_ascii("") == ""
+
+def test_task_strips_non_ascii():
+    task = Task(name="café", schedule="* * * * *", command="echo hi")
+    assert task.name == "caf"
+
+def test_task_requires_command_for_shell():
+    with pytest.raises(ValidationError):
+        Task(name="t", schedule="* * * * *", type=TaskType.SHELL_COMMAND, command="")
+
+def test_execution_strips_non_ascii():
+    execution = TaskExecution(task_id="task_1", output="ok ✓")
+    assert execution.output == "ok "
+
+def test_task_requires_type_specific_fields():
+    with pytest.raises(ValidationError):
+        Task(name="t", schedule="* * * * *", type=TaskType.API_CALL)
+    with pytest.raises(ValidationError):
+        Task(name="t", schedule="* * * * *", type="reminder", reminder_message="✓")
+    task = Task(name="t", schedule="* * * * *", type=TaskType.AI, prompt="hi")
+    assert task.prompt == "hi"
+
+def test_task_to_dict():
+    task = Task(name="t", schedule="* * * * *", command="echo hi")
+    data = task.to_dict()
+    assert data["type"] == "shell_command"
+    assert data["type"] is TaskType.SHELL_COMMAND
+    assert list(data) == list(Task.model_fields)
+    assert data["status"] == "pending"
+    assert data["created_at"] == task.created_at.isoformat()
+    assert data["next_run"] is None
+    assert data == task.model_dump(mode="json")
+
+def test_execution_to_dict():
+    execution = TaskExecution(task_id="task_1")
+    data = execution.to_dict()
+    assert data["status"] == "running"
+    assert data["start_time"] == execution.start_time.isoformat()
+    assert data["end_time"] is None
+
+def test_task_rejects_unhashable_type():
+    with pytest.raises(ValidationError):
+        Task(name="t", schedule="* * * * *", type=["shell_command"], command="echo hi")